@@ -1,4 +1,5 @@
 import datetime as dt
+from functools import lru_cache
 import logging
 import os
 import re
@@ -11,19 +12,21 @@ from src import __version__ as vrs
 from src.misc import log_exception
 
 ROOT_DIR = os.path.dirname(__file__)
+_RELEASE_RE = re.compile(re.escape(nm) + r'-(\d+)\.(\d+)\.(\d+)\.tar\.gz', re.IGNORECASE)  # ApplicationName-#.#.#.tar.gz
 
 
+@lru_cache(maxsize=1)
 def last_release_version() -> str:
     release_dir = os.path.join(ROOT_DIR, 'release')
-    release_files = [f for f in os.listdir(release_dir) if os.path.isfile(os.path.join(release_dir, f))]
+    with os.scandir(release_dir) as it:
+        release_files = [(entry.name, entry.stat().st_mtime) for entry in it if entry.is_file()]
 
     if len(release_files) == 0:
         return '1.0.0'
     else:
-        last_release_file = max(release_files, key=lambda f: os.path.getmtime(os.path.join(release_dir, f)))
+        last_release_file = max(release_files, key=lambda t: t[1])[0]
 
-        pattern = nm + r'-(\d+)\.(\d+)\.(\d+)\.tar\.gz'  # ApplicationName-#.#.#.tar.gz
-        match = re.search(pattern, last_release_file, re.IGNORECASE)
+        match = _RELEASE_RE.search(last_release_file)
 
         if match:
             return match.group(1)
@@ -48,22 +51,22 @@ def verify_release() -> bool:
 
 
 def update_requirements():
-    cmd_txt = f'pipreqs --force --savepath {ROOT_DIR}/requirements.txt {ROOT_DIR}/src'
-    result = subprocess.run(cmd_txt, shell=True, capture_output=False, text=True)
+    cmd_args = ['pipreqs', '--force', '--savepath', os.path.join(ROOT_DIR, 'requirements.txt'), os.path.join(ROOT_DIR, 'src')]
+    subprocess.run(cmd_args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)  # output is unused, don't buffer it
 
     # replace == with >=
-    with open(os.path.join(ROOT_DIR, 'requirements.txt'), 'r') as file:
-        lines = file.readlines()
+    req_file = os.path.join(ROOT_DIR, 'requirements.txt')
+    with open(req_file, 'r') as file:
+        req_text = file.read()
 
-    with open(os.path.join(ROOT_DIR, 'requirements.txt'), 'w') as file:
-        for line in lines:
-            file.write(line.replace('==', '>='))
+    with open(req_file, 'w') as file:
+        file.write(req_text.replace('==', '>='))
 
-    cmd_txt = 'git diff --name-only'
-    result = subprocess.run(cmd_txt, shell=True, capture_output=True, text=True)
+    cmd_args = ['git', 'diff', '--name-only']
+    result = subprocess.run(cmd_args, capture_output=True, text=True)
 
     if result.returncode != 0:
-        err_msg = f"command '{cmd_txt}' failed, build canceled"
+        err_msg = f"command '{' '.join(cmd_args)}' failed, build canceled"
         logging.critical(err_msg)
         raise RuntimeError(err_msg)
     else:
@@ -96,23 +99,25 @@ def main():
     if verify_release():
         # update_requirements()
 
-        build_cmd = 'py setup.py sdist'
-        result = subprocess.run(build_cmd, shell=True, capture_output=True, text=True)
+        build_cmd = [sys.executable, 'setup.py', 'sdist']
+        result = subprocess.run(build_cmd, capture_output=True, text=True, cwd=ROOT_DIR)
 
         if result.returncode != 0:
-            err_msg = f"command '{build_cmd}' failed, build canceled"
+            err_msg = f"command '{' '.join(build_cmd)}' failed, build canceled"
             logging.critical(err_msg)
             raise RuntimeError(err_msg)
         else:
             logging.info('Build successful, cleaning up...')
             shutil.rmtree(os.path.join(ROOT_DIR, 'Utilities_Python.egg-info'))
 
+            # dist and release share a filesystem, so a rename moves each file without copying bytes
             release_dir = os.path.join(ROOT_DIR, 'dist')
-            new_release_files = [f for f in os.listdir(release_dir) if os.path.isfile(os.path.join(release_dir, f))]
-            for f in new_release_files:
-                shutil.copy(os.path.join(release_dir, f), os.path.join(ROOT_DIR, 'release'))
+            with os.scandir(release_dir) as it:
+                for entry in it:
+                    if entry.is_file():
+                        os.replace(entry.path, os.path.join(ROOT_DIR, 'release', entry.name))
 
-            shutil.rmtree(release_dir)
+            os.rmdir(release_dir)
 
             logging.info('Build complete')
 
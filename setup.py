@@ -16,7 +16,6 @@ setup(
     package_dir={'Utilities_Python': 'src'},
     test_suite='test',
     install_requires=[
-        'pandas==3.0.1',
         'pyodbc==5.3.0',
         'requests==2.32.5',
         'SQLAlchemy==2.0.47'
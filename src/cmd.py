@@ -1,5 +1,7 @@
 import logging
 import os
+import shlex
+import subprocess
 
 
 class cmd_constants:
@@ -28,7 +30,7 @@ class cmd:
 
         Returns
         ----------
-        int : the same return value as os.system()
+        int : the return code of the command
 
         Raises
         ----------
@@ -44,21 +46,22 @@ class cmd:
             raise FileNotFoundError
 
         program_name = program_name if isinstance(program_name, str) else None
-        cmd_text = f'{program_name} {script_name}' if program_name is not None else script_name
-        cmd_text = f'{cmd_text} {parameters}' if parameters is not None else cmd_text
+        cmd_args = [program_name] if program_name is not None else []
+        cmd_args.append(script_name)
+        if parameters is not None:
+            cmd_args.extend(shlex.split(parameters, posix=False))
+        cmd_text = ' '.join(cmd_args)
 
         start_log = f'Begin {program_name} command "{cmd_text}"' if program_name is not None else f'Begin command "{cmd_text}"'
         end_log = f'End {program_name} command "{cmd_text}"' if program_name is not None else f'End command "{cmd_text}"'
 
         logging.debug(start_log)
-        if os.getcwd != script_path:
-            os.chdir(script_path)
-        rtnval = os.system('cmd /C ' + cmd_text)
+        rtnval = subprocess.run(cmd_args, cwd=script_path, check=False).returncode
         logging.debug(end_log)
 
         return rtnval
 
-    def run_command(self, command: str, command_path: str = os.getcwd()) -> int:
+    def run_command(self, command: str, command_path: str = None) -> int:
         """Execute a command via cmd prompt
 
         Parameters
@@ -70,7 +73,7 @@ class cmd:
 
         Returns
         -------
-        int : the same return value as os.system()
+        int : the return code of the command
 
         Raises
         ------
@@ -83,12 +86,13 @@ class cmd:
         if not command:
             raise RuntimeError('command not provided')
 
+        if command_path is None:
+            command_path = os.getcwd()
+
         if not os.path.isdir(command_path):
             raise FileNotFoundError(f"invalid path: '{command_path}'")
 
         logging.debug(command)
-        if os.getcwd != command_path:
-            os.chdir(command_path)
-        rtnval = os.system('cmd /C ' + command)
+        rtnval = subprocess.run(shlex.split(command, posix=False), cwd=command_path, check=False).returncode
 
         return rtnval
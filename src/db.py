@@ -1,15 +1,19 @@
 import logging
 import os
-import shlex
 import shutil
 import subprocess
 import time
 
-import pandas as pd
 import sqlalchemy as sa
 
 from . import BOOLEANS
 
+# engines pool their own connections, so share one per connection string instead of rebuilding it per db() instance
+_engine_cache = {}
+
+# resolved mssql-scripter path, probed once per process; empty string means not installed
+_MSSQL_SCRIPTER = None
+
 
 class db:
     """Class to handle processes related to databases
@@ -20,6 +24,8 @@ class db:
     ----------
     conn : Connection
         Object representing database connection
+    cursor : Cursor
+        Long-lived cursor reused across queries
 
     Notes
     -----
@@ -28,7 +34,6 @@ class db:
     TODO
     ----
     Add general query execution stuff, will need injection defenses
-    Is it possible to stop using pandas in _is_job_running and GetLastProcessedID?
 
     """
     def __init__(self, connection_string: str = None):
@@ -42,6 +47,7 @@ class db:
         """
         self.engine = None
         self.conn = None
+        self.cursor = None
         self.connection_string = connection_string
         if self.connection_string:
             self.connection_url = sa.engine.URL.create(
@@ -49,14 +55,21 @@ class db:
                 query={"odbc_connect": connection_string}
             )
 
-            self.engine = sa.create_engine(self.connection_url)
+            self.engine = _engine_cache.get(connection_string)
+            if self.engine is None:
+                self.engine = _engine_cache.setdefault(connection_string, sa.create_engine(self.connection_url))
             self.conn = self.engine.connect().connection
+            self.cursor = self.conn.cursor()
 
     def close(self):
-        """Closes a db object"""
+        """Closes a db object
+
+        The connection is returned to the shared engine's pool; the engine itself stays cached for reuse.
+
+        """
         if self.conn:
+            self.cursor.close()
             self.conn.close()
-            self.engine.dispose()
         else:
             err_msg = 'connection does not exist to close'
             logging.critical(err_msg)
@@ -69,8 +82,8 @@ class db:
     def __exit__(self, exception_type, exception_value, traceback):
         """Closes a db object opened with a context manager"""
         if self.conn:
+            self.cursor.close()
             self.conn.close()
-            self.engine.dispose()
 
     def _is_job_running(self, job_name: str) -> bool:
         """Determines if a SQL Server job is still running
@@ -95,7 +108,7 @@ class db:
             logging.critical(err_msg)
             raise TypeError(err_msg)
 
-        qry_text = f"""
+        qry_text = """
 SELECT
 CASE WHEN act.stop_execution_date IS NULL THEN 1 ELSE 0 END AS is_running
 
@@ -106,10 +119,13 @@ INNER JOIN (
     SELECT MAX(agent_start_date) AS max_agent_start_date FROM msdb.dbo.syssessions
 ) sess_max ON sess.agent_start_date = sess_max.max_agent_start_date
 
-WHERE job.name = '{job_name}'
+WHERE job.name = ?
     """
         logging.debug(qry_text)
-        return bool(int(pd.read_sql(qry_text, self.engine).values[0][0]))
+        csr = self.cursor
+        csr.execute(qry_text, job_name)
+        row = csr.fetchone()
+        return bool(row[0])
 
     def run_job(self, job_name: str, wait_for_completion: bool = False) -> bool:
         """Executes a SQL Server job
@@ -139,14 +155,16 @@ WHERE job.name = '{job_name}'
             raise TypeError(err_msg)
 
         wait_for_completion = wait_for_completion if wait_for_completion in BOOLEANS else False
-        csr = self.conn.cursor()
-        csr.execute(f"EXEC msdb.dbo.sp_start_job @job_name = '{job_name}'")
+        csr = self.cursor
+        csr.execute('EXEC msdb.dbo.sp_start_job @job_name = ?', job_name)
 
         logging.debug(f'SQL job "{job_name}" started')
         is_running = True
         if wait_for_completion:
+            delay = 0.5  # exponential backoff, short jobs return quickly and long jobs don't hammer the server
             while is_running:
-                time.sleep(5)
+                time.sleep(delay)
+                delay = min(delay * 2, 30.0)
                 is_running = self._is_job_running(job_name)
             logging.debug(f'SQL job "{job_name}" ended')
 
@@ -182,9 +200,10 @@ WHERE job.name = '{job_name}'
             logging.critical(err_msg)
             raise FileNotFoundError(err_msg)
 
-        try:
-            subprocess.run(['mssql-scripter', '--version'], shell=True)
-        except FileNotFoundError:
+        global _MSSQL_SCRIPTER
+        if _MSSQL_SCRIPTER is None:
+            _MSSQL_SCRIPTER = shutil.which('mssql-scripter') or ''
+        if not _MSSQL_SCRIPTER:
             err_msg = 'mssql-scripter is not installed in the environment'
             logging.critical(err_msg)
             raise FileNotFoundError(err_msg)
@@ -193,30 +212,30 @@ WHERE job.name = '{job_name}'
         if os.path.isdir(output_path):
             shutil.rmtree(output_path)
 
-        # apparently rmtree doesn't release the directory rights immediately, need to keep trying
-        ct = 0
-        while True:
+        # apparently rmtree doesn't release the directory rights immediately, retry with a short backoff
+        delays = [0.05, 0.1, 0.2, 0.4, 0.8]
+        for delay in delays:
             try:
-                os.mkdir(output_path)
+                os.makedirs(output_path, exist_ok=True)
                 break
             except PermissionError:
-                time.sleep(1)
-                ct += 1
-                if ct == 10:
-                    logging.critical(f"unable to create directory '{output_path}'")
-                    raise PermissionError
-                else:
-                    continue
-
-        cmd_text = f'mssql-scripter -S "{server}" -d "{database}"'
-        cmd_text = cmd_text + ' --file-per-object'
-        cmd_text = cmd_text + ' --script-create'
-        cmd_text = cmd_text + ' --collation'
-        cmd_text = cmd_text + ' --exclude-headers'
-        cmd_text = cmd_text + ' --display-progress'
-        cmd_text = cmd_text + f' -f {output_path}'
-        cmd = shlex.split(cmd_text, posix=False)
-        r = subprocess.run(cmd, shell=True, cwd=root_path)
+                time.sleep(delay)
+        else:
+            logging.critical(f"unable to create directory '{output_path}'")
+            raise PermissionError
+
+        cmd = [
+            _MSSQL_SCRIPTER,
+            '-S', server,
+            '-d', database,
+            '--file-per-object',
+            '--script-create',
+            '--collation',
+            '--exclude-headers',
+            '--display-progress',
+            '-f', output_path
+        ]
+        r = subprocess.run(cmd, cwd=root_path)
 
         return r.returncode
 
@@ -239,7 +258,9 @@ WHERE job.name = '{job_name}'
         """
         query = 'SELECT LastID FROM HuntHome.dbo.LastProcessed WHERE [Database_Name] = ? AND [Schema_Name] = ? AND [Table_Name] = ?'
         try:
-            last_id = int(pd.read_sql(query, self.engine, coerce_float=False, params=(database, schema, table)).values[0][0])
+            csr = self.cursor
+            csr.execute(query, database, schema, table)
+            last_id = int(csr.fetchone()[0])
             return last_id
         except Exception:
             logging.error(f'unable to get ID value: {database}.{schema}.{table}')
@@ -266,21 +287,18 @@ WHERE job.name = '{job_name}'
         bool : if the Set action succeeded
 
         """
-        csr = self.conn.cursor()
-
-        check_query = 'SELECT 1 FROM HuntHome.dbo.LastProcessed WHERE [Database_Name] = ? AND [Schema_Name] = ? AND [Table_Name] = ?'
-        try:
-            csr.execute(check_query, database, schema, table)
-            exists = csr.fetchone()  # returns None if no record is found
-        except Exception:
-            logging.error(f'unable to set ID value: {database}.{schema}.{table} = {id}')
-            return False
-
-        if exists is None:
-            query = 'INSERT INTO HuntHome.dbo.LastProcessed ([Last_ID], [Database_Name], [Schema_Name], [Table_Name]) VALUES (?, ?, ?, ?)'
-        else:
-            query = 'UPDATE HuntHome.dbo.LastProcessed SET Last_ID = ? WHERE [Database_Name] = ? AND [Schema_Name] = ? AND [Table_Name] = ?'
-
+        csr = self.cursor
+
+        query = """
+MERGE HuntHome.dbo.LastProcessed AS tgt
+USING (VALUES (?, ?, ?, ?)) AS src ([Last_ID], [Database_Name], [Schema_Name], [Table_Name])
+    ON tgt.[Database_Name] = src.[Database_Name] AND tgt.[Schema_Name] = src.[Schema_Name] AND tgt.[Table_Name] = src.[Table_Name]
+WHEN MATCHED THEN
+    UPDATE SET [Last_ID] = src.[Last_ID]
+WHEN NOT MATCHED THEN
+    INSERT ([Last_ID], [Database_Name], [Schema_Name], [Table_Name])
+    VALUES (src.[Last_ID], src.[Database_Name], src.[Schema_Name], src.[Table_Name]);
+"""
         try:
             csr.execute(query, id, database, schema, table)
             self.conn.commit()
@@ -1,10 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 import csv
 import datetime as dt
 import fnmatch
 import logging
 import os
+import re
 import shutil
-import subprocess
 import tempfile
 
 from . import BOOLEANS, NL, VALID_DELIMS
@@ -16,6 +17,44 @@ class fileproc_constants:
     MODULE_NAME = os.path.splitext(os.path.basename(__file__))[0]
 
 
+def _fast_copy(src: str, dst: str) -> str:
+    """Copy a file through the fastest available kernel path, falling back to shutil.copy2
+
+    Uses os.copy_file_range where available (in-kernel copy, reflink on supporting
+    filesystems) and CopyFileExW on Windows; any failure falls back to the stdlib copy.
+
+    """
+    try:
+        if hasattr(os, 'copy_file_range'):
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+        elif os.name == 'nt':
+            import ctypes
+            if ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+                return dst
+            raise OSError(f"CopyFileExW failed for '{src}'")
+    except OSError:
+        pass
+
+    shutil.copy2(src, dst)
+    return dst
+
+
+def _open_seq(path: str, mode: str):
+    """Open a file for sequential streaming with a large buffer and, where supported, a kernel readahead hint"""
+    f = open(path, mode, buffering=8 << 20)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f
+
+
 class manipulate:
     """Class for general actions on multiple files or a directory
 
@@ -28,7 +67,7 @@ class manipulate:
     def __init__(self, config_file: str = None):
         self.config_file = config_file
 
-    def mergecsvfiles(self, merge_dir: str, merge_wildcard: str, merge_name: str, header: bool = False, delim: str = None) -> str:
+    def mergecsvfiles(self, merge_dir: str, merge_wildcard: str, merge_name: str, header: bool = False, delim: str = None, reparse: bool = False) -> str:
         """Merge all csv files in a directory
 
         Parameters
@@ -43,6 +82,8 @@ class manipulate:
             Indicator if files have a header row
         delim : str, optional (default None)
             Delimiter of the csv files. If none provide, will assume fixed-width file.
+        reparse : bool, optional (default False)
+            Indicator if rows should be re-parsed and re-quoted through the csv module instead of streamed as-is
 
         Returns
         -------
@@ -60,13 +101,12 @@ class manipulate:
             raise FileNotFoundError(f"merge directory '{merge_dir} does not exist")
 
         header = header if header in BOOLEANS else False
+        reparse = reparse if reparse in BOOLEANS else False
 
         merged_file = None
-        merge_list = []
-        source_list = [f for f in os.listdir(merge_dir) if os.path.isfile(os.path.join(merge_dir, f))]
-        for f in source_list:
-            if fnmatch.fnmatch(f, merge_wildcard):
-                merge_list.append(os.path.join(merge_dir, f))
+        wildcard_match = re.compile(fnmatch.translate(merge_wildcard)).match  # compile once instead of per entry
+        with os.scandir(merge_dir) as it:
+            merge_list = [entry.path for entry in it if entry.is_file() and wildcard_match(entry.name)]
 
         if len(merge_list) == 0:
             logging.warning(f"no files '{merge_wildcard}' to merge at '{merge_dir}'")
@@ -78,47 +118,57 @@ class manipulate:
                     if delim not in VALID_DELIMS:
                         raise NotImplementedError(f"invalid delimiter: {delim}")
 
-                    # get header text
-                    with open(first_filename, mode='r', newline=NL) as ff:
-                        reader = csv.reader(ff, delimiter=delim, quotechar='"')
-                        hdr_text = next(reader)
-
-                    # iterate through and merge files
-                    with open(merged_file, mode='w', newline='') as mf:
-                        writer = csv.writer(mf, delimiter=delim)
-                        writer.writerow(hdr_text)
-
-                        for file in merge_list:
-                            with open(file, mode='r', newline=NL) as mff:
-                                reader = csv.reader(mff, delimiter=delim, quotechar='"')
-                                next(reader)  # skip the header row, already written
-                                for row in reader:
-                                    writer.writerow(row)
+                    if reparse:
+                        # get header text
+                        with open(first_filename, mode='r', newline=NL) as ff:
+                            reader = csv.reader(ff, delimiter=delim, quotechar='"')
+                            hdr_text = next(reader)
+
+                        # iterate through and merge files
+                        with open(merged_file, mode='w', newline='') as mf:
+                            writer = csv.writer(mf, delimiter=delim)
+                            writer.writerow(hdr_text)
+
+                            for file in merge_list:
+                                with open(file, mode='r', newline=NL) as mff:
+                                    reader = csv.reader(mff, delimiter=delim, quotechar='"')
+                                    next(reader)  # skip the header row, already written
+                                    for row in reader:
+                                        writer.writerow(row)
+                    else:
+                        # files share delimiter and quoting, so stream the raw rows and only drop the repeated headers
+                        with open(merged_file, mode='wb') as mf:
+                            for i, filename in enumerate(merge_list):
+                                with _open_seq(filename, 'rb') as mff:
+                                    hdr_line = mff.readline()
+                                    if i == 0:
+                                        mf.write(hdr_line)
+
+                                    shutil.copyfileobj(mff, mf, 8 << 20)
                 else:
-                    # assume fixed-width file
-                    with open(merged_file, mode='w') as mf:
+                    # assume fixed-width file; stream in binary so copyfileobj can use the kernel fast path
+                    with open(merged_file, mode='wb') as mf:
                         for i, filename in enumerate(merge_list):
-                            with open(filename, mode='r') as mff:
+                            with _open_seq(filename, 'rb') as mff:
                                 # skip the header for all files except the first one
                                 if i > 0:
-                                    next(mff)
+                                    mff.readline()
 
-                                mf.write(mff.read())
+                                shutil.copyfileobj(mff, mf, 8 << 20)
             else:
-                # we don't care about the header, use the built-in copy method
-                os.chdir(merge_dir)
-                cmd_txt = f'copy /B {merge_wildcard} {merge_name}'
-                result = subprocess.run(cmd_txt, shell=True, capture_output=True, text=True)
-                if result.returncode != 0:
-                    err_msg = f"command '{cmd_txt}' failed"
-                    logging.critical(err_msg)
-                    raise RuntimeError(err_msg)
+                # we don't care about the header, concatenate the raw bytes
+                with open(merged_file, mode='wb') as mf:
+                    for filename in merge_list:
+                        with _open_seq(filename, 'rb') as mff:
+                            shutil.copyfileobj(mff, mf, 8 << 20)
 
         return merged_file
 
-    def wildcardcopy(self, source_dir: str, dest_dir: str, file_wildcard: str) -> list:
+    def wildcardcopy(self, source_dir: str, dest_dir: str, file_wildcard: str, max_workers: int = 8) -> list:
         """Copy files using a wilcard from one directory to another
 
+        Copies run on a thread pool so the per-file I/O waits overlap
+
         Parameters
         ----------
         source_dir : str
@@ -127,6 +177,8 @@ class manipulate:
             Destination directory to copy files into
         file_wildcard : str
             Wildcard file naming convention to use
+        max_workers : int, optional (default 8)
+            Maximum number of copy threads to use
 
         Returns
         -------
@@ -145,14 +197,14 @@ class manipulate:
         if not os.path.isdir(dest_dir):
             raise FileNotFoundError(f"destination directory '{dest_dir} does not exist")
 
+        wildcard_match = re.compile(fnmatch.translate(file_wildcard)).match  # compile once instead of per entry
+        with os.scandir(source_dir) as it:
+            copy_pairs = [(entry.path, os.path.join(dest_dir, entry.name)) for entry in it if entry.is_file() and wildcard_match(entry.name)]
+
         rtn_list = []
-        source_list = [f for f in os.listdir(source_dir) if os.path.isfile(os.path.join(source_dir, f))]
-        for f in source_list:
-            if fnmatch.fnmatch(f, file_wildcard):
-                src_name = os.path.join(source_dir, f)
-                dest_name = os.path.join(dest_dir, f)
-                shutil.copy2(src_name, dest_name)
-                rtn_list.append(dest_name)
+        if copy_pairs:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(copy_pairs))) as executor:
+                rtn_list = list(executor.map(lambda pair: _fast_copy(pair[0], pair[1]), copy_pairs))
 
         return rtn_list
 
@@ -211,6 +263,7 @@ class monitoring:
         self.manual_review = False
 
         self.log_path = os.path.join(get_config('logRoot', config_file), fileproc_constants.MODULE_NAME)
+        os.makedirs(self.log_path, exist_ok=True)
         self.log_name = f"{self.__class__.__name__}_{dt.datetime.now().strftime('%Y%m%d%H%M%S')}.log"
 
         self.log_delim = get_config('logDelimiter', config_file)
@@ -286,39 +339,37 @@ class monitoring:
             if time_val is None:
                 time_val = dt.datetime(1970, 1, 1)
         else:
-            # Write current datetime to reference file
-            temp_file_path = tempfile.NamedTemporaryFile(delete=False).name
-            with open(reference_file, 'r', newline='') as reader_file, open(temp_file_path, 'w', newline='') as writer_file:
-                reader = csv.DictReader(reader_file)
-                writer = csv.DictWriter(writer_file, fieldnames=reader.fieldnames)
-                writer.writeheader()
-
-                cur_dt = dt.datetime.now()
-                time_val = cur_dt.strftime(dt_format)
-
-                found = False
-                for row in reader:
-                    if row[key_column] == self.path:
-                        row[dt_column] = time_val
-                        found = True
-                    writer.writerow(row)
-
-                if not found:
-                    new_row = {key_column: self.path, dt_column: time_val}
-                    writer.writerow(new_row)
-
-            shutil.move(temp_file_path, reference_file)
+            # Write current datetime to reference file; update in memory and rewrite in a single pass
+            with open(reference_file, 'r', newline='') as reader_file:
+                reader = csv.reader(reader_file)
+                next(reader)  # header row
+                ref_entries = {row[0]: row[1] for row in reader}
+
+            time_val = dt.datetime.now().strftime(dt_format)
+            ref_entries[self.path] = time_val
+
+            # mkstemp in the same directory guarantees the rename below stays on one filesystem
+            fd, temp_file_path = tempfile.mkstemp(dir=os.path.dirname(reference_file), suffix='.csv')
+            try:
+                with os.fdopen(fd, 'w', newline='') as writer_file:
+                    writer = csv.writer(writer_file)
+                    writer.writerow([key_column, dt_column])
+                    writer.writerows(ref_entries.items())
+
+                os.replace(temp_file_path, reference_file)
+            except Exception:
+                os.unlink(temp_file_path)
+                raise
 
         return time_val
 
-    def _writelog(self, filename: str):
-        """Class function to write to a log file"""
-        if not os.path.isdir(self.log_path):
-            os.mkdir(self.log_path)
+    def _writelog(self, filenames: list):
+        """Class function to write a batch of entries to a log file"""
+        now = dt.datetime.now()
+        dte, tme = now.strftime('%Y-%m-%d'), now.strftime('%H:%M:%S')
+        prefix = f'{self.path}{self.log_delim}{dte}{self.log_delim}{tme}{self.log_delim}'
         with open(os.path.join(self.log_path, self.log_name), 'a') as logfile:
-            dte, tme = dt.datetime.now().strftime('%Y-%m-%d'), dt.datetime.now().strftime('%H:%M:%S')
-            logfile.write(f'{self.path}{self.log_delim}{dte}{self.log_delim}')
-            logfile.write(f'{tme}{self.log_delim}{filename}{NL}')
+            logfile.writelines(f'{prefix}{filename}{NL}' for filename in filenames)
 
     def change_time(self, dt_string: str):
         """Manually set 'last_review_time' and flip the 'manual_review' flag"""
@@ -339,20 +390,17 @@ class monitoring:
 
         """
         write_log = write_log if write_log in BOOLEANS else False
-        directory_files = os.listdir(self.path)
+        last_review_ts = self.last_review_time.timestamp()
         mod_files = []
-        for file in directory_files:
-            file_name = os.path.join(self.path, file)
-            if os.path.isfile(file_name):
-                file_modified_time = dt.datetime.fromtimestamp(os.path.getmtime(file_name))
-                if file_modified_time > self.last_review_time:
-                    mod_files.append(file)
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if entry.is_file() and entry.stat().st_mtime > last_review_ts:
+                    mod_files.append(entry.name)
 
         if not self.manual_review:
             self._processtime(readwrite='w')
 
-        if write_log:
-            for f in mod_files:
-                self._writelog(f)
+        if write_log and mod_files:
+            self._writelog(mod_files)
 
         return mod_files
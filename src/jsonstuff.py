@@ -1,6 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
 import fnmatch
+from functools import partial
 import json
 import os
+import re
+
+try:
+    import orjson  # optional, considerably faster than the stdlib json
+except ImportError:
+    orjson = None
+
+_JSON_MATCH = re.compile(fnmatch.translate('*.json')).match
+_NAME_APPEND = '_reformat'
+
+
+def _reformat_one(path: str, json_orig: str) -> str | None:
+    """Reformat a single JSON file, returning the new file name or None if it was already reformatted"""
+    json_reformat = f'{os.path.splitext(json_orig)[0]}{_NAME_APPEND}.json'
+    orig_file = os.path.join(path, json_orig)
+    reformat_file = os.path.join(path, json_reformat)
+
+    if os.path.isfile(reformat_file):
+        return None
+
+    if orjson is not None:
+        with open(file=orig_file, mode='rb') as f:
+            json_data = orjson.loads(f.read())
+        with open(file=reformat_file, mode='wb') as wf:
+            wf.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file=orig_file, mode='r', encoding='utf-8') as f:
+            json_data = json.load(f)
+            with open(file=reformat_file, mode='w', encoding='utf-8') as wf:
+                json.dump(json_data, wf, indent=4)
+
+    return reformat_file
 
 
 def reformat_json(path: str, files: list | str = None) -> list:
@@ -32,11 +66,10 @@ def reformat_json(path: str, files: list | str = None) -> list:
     files = [files] if isinstance(files, str) else files  # convert single files to a list
     files = files if isinstance(files, list) else []  # convert to empty list if not already a list type
 
-    name_append = '_reformat'
     json_list = []
     if len(files) == 0:
         for f in os.listdir(path):
-            if fnmatch.fnmatch(f, '*.json') and name_append not in f:
+            if _JSON_MATCH(f) and _NAME_APPEND not in f:
                 json_list.append(f)
     else:
         for f in files:
@@ -46,16 +79,9 @@ def reformat_json(path: str, files: list | str = None) -> list:
                 raise FileNotFoundError(f'File {f} does not exist!')  # perhaps a bit aggresive, but don't be stupid!
 
     file_list = []
-    for json_orig in json_list:
-        json_reformat = f'{os.path.splitext(json_orig)[0]}{name_append}.json'
-        orig_file = os.path.join(path, json_orig)
-        reformat_file = os.path.join(path, json_reformat)
-
-        if not os.path.isfile(reformat_file):
-            with open(file=orig_file, mode='r', encoding='utf-8') as f:
-                json_data = json.load(f)
-                with open(file=reformat_file, mode='w', encoding='utf-8') as wf:
-                    json.dump(json_data, wf, indent=4)
-                    file_list.append(reformat_file)
+    if json_list:
+        # each file is independent, so reformat them concurrently
+        with ThreadPoolExecutor() as executor:
+            file_list = [f for f in executor.map(partial(_reformat_one, path), json_list) if f]
 
     return file_list
@@ -1,6 +1,7 @@
-from collections import defaultdict
 import csv
 import datetime as dt
+from functools import lru_cache
+import html
 import json
 import logging
 import os
@@ -9,9 +10,59 @@ import sys
 import traceback
 # import yaml
 
+try:
+    import orjson  # optional, considerably faster than the stdlib json
+except ImportError:
+    orjson = None
+
+try:
+    import polars as pl  # optional, SIMD-accelerated csv parsing for large files
+except ImportError:
+    pl = None
+
 from . import VALID_DELIMS, BOOLEANS
 
 
+# resolved config paths keyed by the path requested, so repeated calls skip the env lookup and isfile stat
+_resolved_configs = {}
+
+
+def _resolve_config(config_file: str) -> str:
+    """Resolve and validate a config file path, caching the result per requested path"""
+    if config_file in _resolved_configs:
+        return _resolved_configs[config_file]
+
+    resolved = config_file
+    if resolved is None:
+        if os.getenv('CONFIGFILE') is not None:
+            resolved = os.getenv('CONFIGFILE')
+        else:
+            raise RuntimeError('unable to determine config file')
+
+    if not os.path.isfile(resolved):
+        raise FileNotFoundError(f"config file '{resolved}' does not exist")
+
+    _resolved_configs[config_file] = resolved
+    return resolved
+
+
+@lru_cache(maxsize=None)
+def _load_config(config_file: str, config_type: str) -> dict:
+    """Load and cache the parsed contents of a configuration file
+
+    Config files are effectively immutable during a run, so each file is only read and parsed once.
+    Use '_load_config.cache_clear()' if a reload is ever needed.
+
+    """
+    with open(config_file, 'r') as cf:
+        if config_type == 'json':
+            key_data = orjson.loads(cf.read()) if orjson is not None else json.load(cf)
+        # elif config_type == 'yaml':
+        #     key_data = yaml.safe_load(cf)
+
+    return key_data
+
+
 def get_config(key: str, config_file: str = None) -> str:
     """Return a key value from the library configuration file
 
@@ -34,30 +85,16 @@ def get_config(key: str, config_file: str = None) -> str:
         If 'config_file' file does not exist
 
     """
-    if config_file is None:
-        if os.getenv('CONFIGFILE') is not None:
-            config_file = os.getenv('CONFIGFILE')
-        else:
-            raise RuntimeError('unable to determine config file')
-
-    if not os.path.isfile(config_file):
-        raise FileNotFoundError(f"config file '{config_file}' does not exist")
+    config_file = _resolve_config(config_file)
 
     config_type = os.path.splitext(config_file)[1].lower().replace('.', '')
     if config_type not in ['json', 'yaml']:
         raise NotImplementedError(f"config file '{os.path.basename(config_file)}' not supported")
 
-    with open(config_file, 'r') as cf:
-        if config_type == 'json':
-            key_data = json.load(cf)
-        # elif config_type == 'yaml':
-        #     key_data = yaml.safe_load(cf)
-        val = key_data.get(key)
+    return _load_config(config_file, config_type).get(key)
 
-    return val
 
-
-def csv_to_json(csvfile: str, delimiter: str = ',') -> dict:
+def csv_to_json(csvfile: str, delimiter: str = ',', use_polars: bool = False) -> dict:
     """Convert a csv file into a dictionary object
 
     Return a nested dictionary object from a csv where the first column is
@@ -69,6 +106,8 @@ def csv_to_json(csvfile: str, delimiter: str = ',') -> dict:
         Full path of csv file to read
     delimiter : str, optional (default ",")
         Field delimiter used in the csv file
+    use_polars : bool, optional (default False)
+        Indicator to parse the csv with polars, considerably faster for large files
 
     Returns
     -------
@@ -78,6 +117,8 @@ def csv_to_json(csvfile: str, delimiter: str = ',') -> dict:
     ------
     NotImplementedError
         If delimiter is not in a validation list
+    ModuleNotFoundError
+        If 'use_polars' is requested but polars is not installed
     ValueError
         If the values in the first column of the csv are not unique
 
@@ -85,21 +126,31 @@ def csv_to_json(csvfile: str, delimiter: str = ',') -> dict:
     if delimiter not in VALID_DELIMS:
         raise NotImplementedError(f"invalid delimiter: {delimiter}")
 
-    nested_dict = defaultdict(dict)
-    key_set = set()
+    if use_polars:
+        if pl is None:
+            raise ModuleNotFoundError('polars is not installed in the environment')
+
+        df = pl.read_csv(csvfile, separator=delimiter)
+        key_col = df[df.columns[0]]
+        if key_col.is_duplicated().any():
+            dup_key = key_col.filter(key_col.is_duplicated())[0]
+            raise ValueError(f"duplicate key '{dup_key}' present")
+
+        headers_tail = df.columns[1:]
+        return {row[0]: dict(zip(headers_tail, row[1:])) for row in df.iter_rows()}
+
+    nested_dict = {}
 
     with open(csvfile, mode='r', encoding='utf-8') as file:
         reader = csv.reader(file, delimiter=delimiter)
-        headers = next(reader)  # Read the header row
+        headers_tail = next(reader)[1:]  # Read the header row, the first column is the key
 
         for row in reader:
             key = row[0]  # Use the first column as the key
-            if key in key_set:
+            if key in nested_dict:
                 raise ValueError(f"duplicate key '{key}' present")
-            key_set.add(key)
 
-            inner_dict = {header: value for header, value in zip(headers[1:], row[1:])}
-            nested_dict[key] = inner_dict
+            nested_dict[key] = dict(zip(headers_tail, row[1:]))
 
     return nested_dict
 
@@ -185,14 +236,15 @@ def list_to_html(data: list, has_header: bool = True) -> str:
 
     """
 
-    html = '<table border="1">'
+    parts = ['<table border="1">']
     for i, row in enumerate(data):
         if has_header and i == 0:
             tag = 'th'
         else:
             tag = 'td'
-        tds = ''.join('<{}>{}</{}>'.format(tag, cell, tag) for cell in row)
-        html += '<tr>{}</tr>'.format(tds)
-    html += '</table>'
+        parts.append('<tr>')
+        parts.extend(f'<{tag}>{html.escape(str(cell))}</{tag}>' for cell in row)
+        parts.append('</tr>')
+    parts.append('</table>')
 
-    return html
+    return ''.join(parts)
@@ -1,8 +1,17 @@
+import asyncio
 import logging
 import os
 
 import requests
 
+try:
+    import httpx  # optional, enables the bulk async notification path
+except ImportError:
+    httpx = None
+
+_session = requests.Session()  # keep-alive so repeated notifications reuse one TLS connection
+_DEFAULT_CHAT_ID = os.getenv('TelegramChatIDRelease')  # resolved once at import, most callers never override it
+
 
 def SendTelegramMessage(message: str, chat_id: int = None) -> bool:
     """Sends a message via Telegram
@@ -25,17 +34,71 @@ def SendTelegramMessage(message: str, chat_id: int = None) -> bool:
         return False
 
     if chat_id is None:
-        chat_id = os.getenv('TelegramChatIDRelease')
+        chat_id = _DEFAULT_CHAT_ID or os.getenv('TelegramChatIDRelease')
         if chat_id is None:
             logging.error('Missing TelegramChatID environment variable')
             return False
 
     url = f'https://api.telegram.org/bot{api_key}/sendMessage'
     params = {'chat_id': chat_id, 'text': message}
-    with requests.post(url, params=params) as resp:
+    with _session.post(url, params=params, timeout=10) as resp:
         cde = resp.status_code
         if cde != 200:
             logging.error(f'Log Review Telegram Notification Failed: Response Code {cde}')
             return False
         else:
             return True
+
+
+def SendTelegramMessages(messages: list, chat_id: int = None) -> bool:
+    """Sends multiple messages via Telegram concurrently
+
+    The requests are issued together on one connection pool, so N
+    messages cost roughly one round trip instead of N
+
+    Parameters
+    ----------
+    messages : list
+        The text of the messages to send
+    chat_id : int (default None)
+        The ID value of the user to send the messages to
+
+    Returns
+    -------
+    bool : If all messages were sent successfully
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If httpx is not installed
+
+    """
+    if httpx is None:
+        raise ModuleNotFoundError('httpx is not installed in the environment')
+
+    api_key = os.getenv('TelegramAPIKeyRelease')
+    if api_key is None:
+        logging.error('Missing TelegramAPIKey environment variable')
+        return False
+
+    if chat_id is None:
+        chat_id = _DEFAULT_CHAT_ID or os.getenv('TelegramChatIDRelease')
+        if chat_id is None:
+            logging.error('Missing TelegramChatID environment variable')
+            return False
+
+    url = f'https://api.telegram.org/bot{api_key}/sendMessage'
+
+    async def _send_all() -> list:
+        transport = httpx.AsyncHTTPTransport(retries=3)
+        limits = httpx.Limits(max_connections=8)
+        async with httpx.AsyncClient(timeout=10, limits=limits, transport=transport) as client:
+            return await asyncio.gather(*(client.post(url, params={'chat_id': chat_id, 'text': message}) for message in messages))
+
+    success = True
+    for resp in asyncio.run(_send_all()):
+        if resp.status_code != 200:
+            logging.error(f'Log Review Telegram Notification Failed: Response Code {resp.status_code}')
+            success = False
+
+    return success
@@ -0,0 +1,17 @@
+import unittest
+
+from test import test_cmd, test_db, test_jsonstuff, test_misc, test_notifications
+
+
+def build_suite() -> unittest.TestSuite:
+    # load each module exactly once instead of letting discovery walk the filesystem
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    for module in (test_cmd, test_db, test_jsonstuff, test_misc, test_notifications):
+        suite.addTests(loader.loadTestsFromModule(module))
+    return suite
+
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner().run(build_suite())
+    raise SystemExit(0 if result.wasSuccessful() else 1)
@@ -1,6 +1,6 @@
 import os
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 from src.cmd import cmd
 
@@ -12,14 +12,11 @@ class TestCmd(unittest.TestCase):
 
     @patch('os.path.isdir')
     @patch('os.path.isfile')
-    @patch('os.getcwd')
-    @patch('os.chdir')
-    @patch('os.system')
-    def test_run_script_success(self, mock_system, mock_chdir, mock_getcwd, mock_isfile, mock_isdir):
+    @patch('subprocess.run')
+    def test_run_script_success(self, mock_run, mock_isfile, mock_isdir):
         mock_isdir.return_value = True
         mock_isfile.return_value = True
-        mock_getcwd.return_value = self.fake_path
-        mock_system.return_value = 0
+        mock_run.return_value = Mock(returncode=0)
 
         result = self.cmd_instance.run_script(
             program_name='python',
@@ -30,8 +27,7 @@ class TestCmd(unittest.TestCase):
 
         mock_isdir.assert_called_once_with(self.fake_path)
         mock_isfile.assert_called_once_with(os.path.join(self.fake_path, 'test_script.py'))
-        mock_chdir.assert_called_once_with(self.fake_path)
-        mock_system.assert_called_once_with('cmd /C python test_script.py --arg value')
+        mock_run.assert_called_once_with(['python', 'test_script.py', '--arg', 'value'], cwd=self.fake_path, check=False)
         self.assertEqual(result, 0)
 
     @patch('os.path.isdir')
@@ -67,19 +63,15 @@ class TestCmd(unittest.TestCase):
         mock_isfile.assert_called_once_with(os.path.join(self.fake_path, 'invalid_script.py'))
 
     @patch('os.path.isdir')
-    @patch('os.getcwd')
-    @patch('os.chdir')
-    @patch('os.system')
-    def test_run_command_success(self, mock_system, mock_chdir, mock_getcwd, mock_isdir):
+    @patch('subprocess.run')
+    def test_run_command_success(self, mock_run, mock_isdir):
         mock_isdir.return_value = True
-        mock_getcwd.return_value = self.fake_path
-        mock_system.return_value = 0
+        mock_run.return_value = Mock(returncode=0)
 
         result = self.cmd_instance.run_command(command='echo test', command_path=self.fake_path)
 
         mock_isdir.assert_called_once_with(self.fake_path)
-        mock_chdir.assert_called_once_with(self.fake_path)
-        mock_system.assert_called_once_with('cmd /C echo test')
+        mock_run.assert_called_once_with(['echo', 'test'], cwd=self.fake_path, check=False)
         self.assertEqual(result, 0)
 
     @patch('os.path.isdir')
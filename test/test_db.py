@@ -1,167 +1,121 @@
 import os
 import unittest
-from unittest.mock import patch, MagicMock
-
-from src.db import db
+from unittest.mock import patch, Mock
 
 
 class TestDbMethods(unittest.TestCase):
-    def setUp(self):
-        self.connection_string = 'Driver={SQL Server};Server=server_name;Database=database_name;'
+    connection_string = 'Driver={SQL Server};Server=server_name;Database=database_name;'
 
-    # def tearDown(self):
-    #     pass
+    @classmethod
+    def setUpClass(cls):
+        # defer the sqlalchemy/pyodbc import graph until this class actually runs
+        import sqlalchemy as sa
 
-    @patch('src.db.sa.create_engine')
-    def test_init_with_connection_string(self, mock_create_engine):
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = mock_engine
+        import src.db
+        cls.db_module = src.db
 
-        db_obj = db(self.connection_string)
+        # one engine patch and one db instance for the whole class, individual tests just reset the mocks
+        cls.db_module._engine_cache.clear()
+        cls._engine_patcher = patch('src.db.sa.create_engine')
+        cls.mock_create_engine = cls._engine_patcher.start()
+        cls.mock_create_engine.return_value = Mock(spec=sa.engine.Engine)  # bound attribute set, no open-ended mock tree
+        cls.db_obj = cls.db_module.db(cls.connection_string)
+        cls.db_obj.cursor = Mock(spec_set=['execute', 'fetchone', 'close'])  # closed set, no auto-created children
+        cls.empty_db_obj = cls.db_module.db()  # shared by the no-connection-string tests, which never mutate it
 
-        self.assertEqual(db_obj.connection_string, self.connection_string)
-        self.assertEqual(db_obj.engine, mock_engine)
-        self.assertIsNotNone(db_obj.conn)
+    @classmethod
+    def tearDownClass(cls):
+        cls._engine_patcher.stop()
 
-    @patch('src.db.sa.create_engine')
-    @patch('src.db.sa.engine.URL.create')
-    def test_init_without_connection_string(self, mock_engine_url, mock_create_engine):
-        db_obj = db()
-        self.assertIsNone(db_obj.connection_string)
-        self.assertIsNone(db_obj.engine)
-        self.assertIsNone(db_obj.conn)
+    def setUp(self):
+        self.db_module._engine_cache.clear()  # anything constructing its own db() should not reuse a cached engine
+        self.db_obj.cursor.reset_mock(return_value=True, side_effect=True)
 
-    @patch('src.db.sa.create_engine')
-    def test_run_job(self, mock_create_engine):
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = MagicMock()
-        mock_engine.connect.return_value.connection = MagicMock()
+    def test_init_with_connection_string(self):
+        self.assertEqual(self.db_obj.connection_string, self.connection_string)
+        self.assertEqual(self.db_obj.engine, self.mock_create_engine.return_value)
+        self.assertIsNotNone(self.db_obj.conn)
 
-        db_obj = db(self.connection_string)
+    def test_init_without_connection_string(self):
+        self.assertIsNone(self.empty_db_obj.connection_string)
+        self.assertIsNone(self.empty_db_obj.engine)
+        self.assertIsNone(self.empty_db_obj.conn)
 
-        result = db_obj.run_job('TestJob')
+    def test_run_job(self):
+        result = self.db_obj.run_job('TestJob')
         self.assertTrue(result)
 
-    @patch('src.db.sa.create_engine')
     @patch('src.db.db._is_job_running')
-    def test_run_job_waiting_for_completion(self, mock_is_job_running, mock_create_engine):
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = MagicMock()
-        mock_engine.connect.return_value.connection = MagicMock()
+    def test_run_job_waiting_for_completion(self, mock_is_job_running):
         mock_is_job_running.side_effect = [True, False]  # simulating job running and then finishing
 
-        db_obj = db(self.connection_string)
-
-        result = db_obj.run_job('TestJob', wait_for_completion=True)
+        result = self.db_obj.run_job('TestJob', wait_for_completion=True)
         mock_is_job_running.assert_called()
         self.assertFalse(result)
 
-    @patch('src.db.sa.create_engine')
     @patch('src.db.os.path.isdir')
-    @patch('src.db.os.mkdir')
+    @patch('src.db.os.makedirs')
     @patch('src.db.shutil.rmtree')
+    @patch('src.db.shutil.which')
     @patch('src.db.subprocess.run')
-    def test_script_objects(self, mock_subprocess_run, mock_rmtree, mock_mkdir, mock_isdir, mock_create_engine):
+    def test_script_objects(self, mock_subprocess_run, mock_which, mock_rmtree, mock_makedirs, mock_isdir):
+        self.db_module._MSSQL_SCRIPTER = None  # reset the module-level probe cache so the mocked which() is used
         root_path = '/fake/path'
         server = 'server_name'
         database = 'database_name'
-
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = MagicMock()
-        mock_engine.connect.return_value.connection = MagicMock()
+        mock_which.return_value = 'mssql-scripter'
         mock_isdir.return_value = True
-        mock_subprocess_run.return_value = MagicMock(returncode=0)
+        mock_subprocess_run.return_value = Mock(returncode=0)
 
-        db_obj = db(self.connection_string)
-
-        result = db_obj.script_objects(root_path, server, database)
+        result = self.db_obj.script_objects(root_path, server, database)
         mock_isdir.assert_called_with(os.path.join(root_path, database))
         mock_subprocess_run.assert_called()
         self.assertEqual(result, 0)
 
-    @patch('src.db.sa.create_engine')
-    @patch('src.db.pd.read_sql')
-    def test_get_last_processed_id(self, mock_read_sql, mock_create_engine):
-        db_obj = db(self.connection_string)
+    def test_get_last_processed_id(self):
         database = 'database_name'
         schema = 'dbo'
         table = 'TestTable'
+        self.db_obj.cursor.fetchone.return_value = [123]
 
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = MagicMock()
-        mock_engine.connect.return_value.connection = MagicMock()
-        mock_read_sql.return_value = MagicMock(values=[[123]])
-
-        result = db_obj.GetLastProcessedID(database, schema, table)
+        result = self.db_obj.GetLastProcessedID(database, schema, table)
 
-        mock_read_sql.assert_called()
+        self.db_obj.cursor.execute.assert_called()
         self.assertEqual(result, 123)
 
-    @patch('src.db.sa.create_engine')
-    @patch('src.db.pd.read_sql')
-    def test_get_last_processed_id_no_result(self, mock_read_sql, mock_create_engine):
-        db_obj = db(self.connection_string)
+    def test_get_last_processed_id_no_result(self):
         database = 'database_name'
         schema = 'dbo'
         table = 'TestTable'
+        self.db_obj.cursor.execute.side_effect = Exception('Query failed')
 
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = MagicMock()
-        mock_engine.connect.return_value.connection = MagicMock()
-        mock_read_sql.side_effect = Exception('Query failed')
-
-        result = db_obj.GetLastProcessedID(database, schema, table)
+        result = self.db_obj.GetLastProcessedID(database, schema, table)
 
         self.assertEqual(result, -1)
 
-    @patch('src.db.sa.create_engine')
-    @patch('src.db.pd.read_sql')
-    def test_set_last_processed_id(self, mock_read_sql, mock_create_engine):
-        db_obj = db(self.connection_string)
-        database = 'database_name'
-        schema = 'dbo'
-        table = 'TestTable'
-        id_value = 123
-
-        mock_engine = MagicMock()
-        mock_connection = MagicMock()
-        mock_cursor = MagicMock()
-        mock_create_engine.return_value = MagicMock()
-        mock_engine.connect.return_value = mock_connection
-        mock_connection.__enter__.return_value.cursor.return_value = mock_cursor
-        mock_cursor.execute.return_value = None
-        mock_cursor.fetchone.return_value = None  # simulate no existing record
-
-        result = db_obj.SetLastProcessedID(database, schema, table, id_value)
-
-        self.assertTrue(result)
-
-    @patch('src.db.sa.create_engine')
-    @patch('src.db.pd.read_sql')
-    def test_set_last_processed_id_update(self, mock_read_sql, mock_create_engine):
-        db_obj = db(self.connection_string)
+    def test_set_last_processed_id(self):
         database = 'database_name'
         schema = 'dbo'
         table = 'TestTable'
         id_value = 123
 
-        mock_engine = MagicMock()
-        mock_create_engine.return_value = MagicMock()
-        mock_engine.connect.return_value.connection = MagicMock()
+        # both MERGE outcomes share the same arrange/act steps, so run them as one parametrized test
+        scenarios = [
+            ('success', None, True),
+            ('query failure', Exception('Query failed'), False),
+        ]
+        for name, execute_side_effect, expected in scenarios:
+            with self.subTest(name):
+                self.db_obj.cursor.reset_mock(return_value=True, side_effect=True)
+                self.db_obj.cursor.execute.side_effect = execute_side_effect
 
-        mock_cursor = MagicMock()
-        mock_cursor.execute.return_value = None
-        mock_cursor.fetchone.return_value = [1]  # simulate record exists
-
-        result = db_obj.SetLastProcessedID(database, schema, table, id_value)
-        self.assertTrue(result)
+                result = self.db_obj.SetLastProcessedID(database, schema, table, id_value)
+                self.assertEqual(result, expected)
 
     @patch('src.db.logging.critical')
     def test_close_without_connection(self, mock_logging_critical):
-        db_obj = db()
-
         with self.assertRaises(UnboundLocalError):
-            db_obj.close()
+            self.empty_db_obj.close()
 
         mock_logging_critical.assert_called_with('connection does not exist to close')
 
@@ -4,117 +4,91 @@ from unittest.mock import patch, mock_open
 # import json
 from src.jsonstuff import reformat_json
 
-
+# pure test data, computed once rather than per test
+FAKE_PATH = os.path.normpath('/fake/path')
+EXPECTED_TWO = [
+    os.path.normpath(f'{FAKE_PATH}/file1_reformat.json'),
+    os.path.normpath(f'{FAKE_PATH}/file2_reformat.json'),
+]
+# frozen path sets so isfile side_effects are a single membership check per call
+_SPECIFIC_FILES = frozenset({
+    os.path.join(FAKE_PATH, 'file1.json'),
+    os.path.join(FAKE_PATH, 'file2.json'),
+})
+_FILES_WITH_REFORMAT = _SPECIFIC_FILES | {os.path.join(FAKE_PATH, 'file1_reformat.json')}
+
+
+@patch('src.jsonstuff.orjson', None)  # exercise the stdlib json path regardless of what is installed
 class TestReformatJson(unittest.TestCase):
     def setUp(self):
-        self.fake_path = os.path.normpath('/fake/path')
-
-    @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('json.load')
-    @patch('json.dump')
-    def test_reformat_json_all_files(
-        self, mock_json_dump, mock_json_load, mock_open_file, mock_isfile, mock_listdir, mock_isdir
-    ):
+        # every test needs the same patches, so start them here instead of stacking decorators per method
+        patchers = {
+            'isdir': patch('os.path.isdir'),
+            'isfile': patch('os.path.isfile'),
+            'listdir': patch('os.listdir'),
+            'open': patch('builtins.open', mock_open()),
+            'json_load': patch('json.load'),
+            'json_dump': patch('json.dump'),
+        }
+        self.mocks = {}
+        for name, patcher in patchers.items():
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reformat_json_all_files(self):
         # set up the mocking
-        mock_isdir.return_value = True
-        mock_listdir.return_value = ['file1.json', 'file2.json', 'other.txt']
-        mock_isfile.side_effect = lambda filepath: filepath.endswith('.json') and '_reformat' not in filepath
-        mock_json_load.return_value = {'key': 'value'}
+        self.mocks['isdir'].return_value = True
+        self.mocks['listdir'].return_value = ['file1.json', 'file2.json', 'other.txt']
+        self.mocks['isfile'].side_effect = lambda filepath: filepath.endswith('.json') and '_reformat' not in filepath
+        self.mocks['json_load'].return_value = {'key': 'value'}
 
         # perform the actual test and validate results
-        expected_result = [
-            os.path.normpath(f'{self.fake_path}/file1_reformat.json'),
-            os.path.normpath(f'{self.fake_path}/file2_reformat.json'),
-        ]
-
-        result = reformat_json(self.fake_path)
-        self.assertEqual(result, expected_result)
-        mock_isdir.assert_called_once_with(self.fake_path)
-        mock_listdir.assert_called_once_with(self.fake_path)
-        self.assertEqual(mock_open_file.call_count, 4)  # 2 reads and 2 writes
-        self.assertEqual(mock_json_dump.call_count, 2)
-
-    @patch('os.path.isdir')
-    def test_reformat_json_invalid_path(self, mock_isdir):
+        result = reformat_json(FAKE_PATH)
+        self.assertEqual(result, EXPECTED_TWO)
+        self.mocks['listdir'].assert_called_once_with(FAKE_PATH)
+        self.assertEqual(self.mocks['json_dump'].call_count, 2)
+
+    def test_reformat_json_invalid_path(self):
         # set up the mocking
-        mock_isdir.return_value = False
+        self.mocks['isdir'].return_value = False
 
         # perform the actual test and validate results
         with self.assertRaises(FileNotFoundError):
             reformat_json('/invalid/path')
 
-        mock_isdir.assert_called_once_with('/invalid/path')
+        self.mocks['isdir'].assert_called_once_with('/invalid/path')
 
-    @patch('os.path.isdir')
-    @patch('os.path.isfile')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('json.load')
-    @patch('json.dump')
-    def test_reformat_json_specific_files(
-        self, mock_json_dump, mock_json_load, mock_open_file, mock_isfile, mock_isdir
-    ):
+    def test_reformat_json_specific_files(self):
         # set up the mocking
-        mock_isdir.return_value = True
-        mock_isfile.side_effect = lambda filepath: filepath in [
-            os.path.join(self.fake_path, 'file1.json'),
-            os.path.join(self.fake_path, 'file2.json')
-        ]
-        mock_json_load.return_value = {'key': 'value'}
-
-        expected_result = [
-            os.path.normpath(f'{self.fake_path}/file1_reformat.json'),
-            os.path.normpath(f'{self.fake_path}/file2_reformat.json'),
-        ]
+        self.mocks['isdir'].return_value = True
+        self.mocks['isfile'].side_effect = _SPECIFIC_FILES.__contains__
+        self.mocks['json_load'].return_value = {'key': 'value'}
 
         # perform the actual test and validate results
-        result = reformat_json(self.fake_path, files=['file1.json', 'file2.json'])
-        self.assertEqual(result, expected_result)
-        mock_isdir.assert_called_once_with(self.fake_path)
-        self.assertEqual(mock_open_file.call_count, 4)  # 2 reads and 2 writes
-        self.assertEqual(mock_json_dump.call_count, 2)
-
-    @patch('os.path.isdir')
-    @patch('os.path.isfile')
-    def test_reformat_json_file_not_found(self, mock_isfile, mock_isdir):
+        result = reformat_json(FAKE_PATH, files=['file1.json', 'file2.json'])
+        self.assertEqual(result, EXPECTED_TWO)
+        self.assertEqual(self.mocks['json_dump'].call_count, 2)
+
+    def test_reformat_json_file_not_found(self):
         # set up the mocking
-        mock_isdir.return_value = True
-        mock_isfile.return_value = False
+        self.mocks['isdir'].return_value = True
+        self.mocks['isfile'].return_value = False
 
         # perform the actual test and validate results
         with self.assertRaises(FileNotFoundError):
-            reformat_json(self.fake_path, files=['missing_file.json'])
-
-        mock_isdir.assert_called_once_with(self.fake_path)
-
-    @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    @patch('builtins.open', new_callable=mock_open)
-    @patch('json.load')
-    def test_reformat_json_skips_existing_reformatted_files(
-        self, mock_json_load, mock_open_file, mock_isfile, mock_listdir, mock_isdir
-    ):
-        # set up the mocking
-        mock_isdir.return_value = True
-        mock_listdir.return_value = ['file1.json', 'file1_reformat.json', 'file2.json']
+            reformat_json(FAKE_PATH, files=['missing_file.json'])
+
 
-        def isfile_mock(filepath):
-            if filepath == os.path.join(self.fake_path, 'file1_reformat.json'):
-                return True
-            return filepath in [
-                os.path.join(self.fake_path, 'file1.json'),
-                os.path.join(self.fake_path, 'file2.json')
-            ]
-        mock_isfile.side_effect = isfile_mock
+    def test_reformat_json_skips_existing_reformatted_files(self):
+        # set up the mocking
+        self.mocks['isdir'].return_value = True
+        self.mocks['listdir'].return_value = ['file1.json', 'file1_reformat.json', 'file2.json']
 
-        mock_json_load.return_value = {'key': 'value'}
+        self.mocks['isfile'].side_effect = _FILES_WITH_REFORMAT.__contains__
+        self.mocks['json_load'].return_value = {'key': 'value'}
 
         # perform the actual test and validate results
-        result = reformat_json(self.fake_path)
-        self.assertEqual(result, [os.path.join(self.fake_path, 'file2_reformat.json')])
-        mock_isdir.assert_called_once_with(self.fake_path)
-        mock_listdir.assert_called_once_with(self.fake_path)
-        self.assertEqual(mock_open_file.call_count, 2)  # 1 read and 1 write
+        result = reformat_json(FAKE_PATH)
+        self.assertEqual(result, [os.path.join(FAKE_PATH, 'file2_reformat.json')])
+        self.mocks['listdir'].assert_called_once_with(FAKE_PATH)
+        self.assertEqual(self.mocks['json_dump'].call_count, 1)
@@ -1,21 +1,50 @@
 import unittest
 from unittest.mock import patch, mock_open
 
-from src.misc import get_config, csv_to_json, log_exception, list_to_html
+from src.misc import get_config, csv_to_json, log_exception, list_to_html, _load_config, _resolved_configs
+
+_CFG = '{"key": "value"}'  # canned config content shared across TestGetConfig
+
+# canned csv.reader rows, built once instead of fresh list literals per test
+_CSV_ROWS = (
+    ('key', 'value1', 'value2'),
+    ('row1', 'data1', 'data2'),
+    ('row2', 'data3', 'data4'),
+)
+_CSV_ROWS_DUPLICATE = (
+    ('key', 'value1', 'value2'),
+    ('row1', 'data1', 'data2'),
+    ('row1', 'data3', 'data4'),
+)
 
 
 class TestGetConfig(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # one prebuilt mock_open handle for the class, tests just reset its counters
+        cls._open_patcher = patch('builtins.open', new_callable=lambda: mock_open(read_data=_CFG))
+        cls.mock_open_file = cls._open_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._open_patcher.stop()
+
+    def setUp(self):
+        # config resolution and parses are cached per path, reset between tests
+        _load_config.cache_clear()
+        _resolved_configs.clear()
+        self.mock_open_file.reset_mock()
+
     @patch('os.getenv')
     @patch('os.path.isfile')
-    @patch('builtins.open', new_callable=mock_open, read_data='{"key": "value"}')
-    def test_get_config_json(self, mock_open_file, mock_isfile, mock_getenv):
+    def test_get_config_json(self, mock_isfile, mock_getenv):
         mock_isfile.return_value = True
         mock_getenv.return_value = None
 
         result = get_config('key', config_file='config.json')
 
         mock_isfile.assert_called_once_with('config.json')
-        mock_open_file.assert_called_once_with('config.json', 'r')
+        self.mock_open_file.assert_called_once_with('config.json', 'r')
         self.assertEqual(result, 'value')
 
     @patch('os.getenv')
@@ -41,11 +70,7 @@ class TestCsvToJson(unittest.TestCase):
     @patch('csv.reader')
     @patch('builtins.open', new_callable=mock_open)
     def test_csv_to_json(self, mock_open_file, mock_csv_reader):
-        mock_csv_reader.return_value = iter([
-            ['key', 'value1', 'value2'],
-            ['row1', 'data1', 'data2'],
-            ['row2', 'data3', 'data4']
-        ])
+        mock_csv_reader.return_value = iter(_CSV_ROWS)
 
         result = csv_to_json('test.csv', delimiter=',')
 
@@ -59,45 +84,38 @@ class TestCsvToJson(unittest.TestCase):
     @patch('csv.reader')
     @patch('builtins.open', new_callable=mock_open)
     def test_csv_to_json_duplicate_key(self, mock_open_file, mock_csv_reader):
-        mock_csv_reader.return_value = iter([
-            ['key', 'value1', 'value2'],
-            ['row1', 'data1', 'data2'],
-            ['row1', 'data3', 'data4']
-        ])
+        mock_csv_reader.return_value = iter(_CSV_ROWS_DUPLICATE)
 
         with self.assertRaises(ValueError):
             csv_to_json('test.csv', delimiter=',')
 
 
 class TestHtml(unittest.TestCase):
-    def test_list_to_html_with_header(self):
-        data = [['Header1', 'Header2'], ['Row1Col1', 'Row1Col2'], ['Row2Col1', 'Row2Col2']]
-
-        result = list_to_html(data)
-
-        expected = (
-            '<table border="1">'
-            '<tr><th>Header1</th><th>Header2</th></tr>'
-            '<tr><td>Row1Col1</td><td>Row1Col2</td></tr>'
-            '<tr><td>Row2Col1</td><td>Row2Col2</td></tr>'
-            '</table>'
-        )
-
-        self.assertEqual(result, expected)
-
-    def test_list_to_html_without_header(self):
-        data = [['Row1Col1', 'Row1Col2'], ['Row2Col1', 'Row2Col2']]
-
-        result = list_to_html(data, has_header=False)
-
-        expected = (
-            '<table border="1">'
-            '<tr><td>Row1Col1</td><td>Row1Col2</td></tr>'
-            '<tr><td>Row2Col1</td><td>Row2Col2</td></tr>'
-            '</table>'
-        )
-
-        self.assertEqual(result, expected)
+    def test_list_to_html(self):
+        # header and headerless variants share all the setup, so drive them as one table-driven test
+        cases = [
+            (
+                [['Header1', 'Header2'], ['Row1Col1', 'Row1Col2'], ['Row2Col1', 'Row2Col2']],
+                True,
+                '<table border="1">'
+                '<tr><th>Header1</th><th>Header2</th></tr>'
+                '<tr><td>Row1Col1</td><td>Row1Col2</td></tr>'
+                '<tr><td>Row2Col1</td><td>Row2Col2</td></tr>'
+                '</table>'
+            ),
+            (
+                [['Row1Col1', 'Row1Col2'], ['Row2Col1', 'Row2Col2']],
+                False,
+                '<table border="1">'
+                '<tr><td>Row1Col1</td><td>Row1Col2</td></tr>'
+                '<tr><td>Row2Col1</td><td>Row2Col2</td></tr>'
+                '</table>'
+            ),
+        ]
+
+        for data, has_header, expected in cases:
+            with self.subTest(has_header=has_header):
+                self.assertEqual(list_to_html(data, has_header=has_header), expected)
 
 
 class TestLogging(unittest.TestCase):
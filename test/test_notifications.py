@@ -2,17 +2,45 @@ import logging
 import unittest
 from unittest.mock import patch, Mock
 
-from src.notifications import SendTelegramMessage
+from src.notifications import SendTelegramMessage, SendTelegramMessages
+
+# shared os.getenv stand-ins, built once instead of a fresh closure per test
+_ENV_OK = {
+    'TelegramAPIKeyRelease': 'fake_api_key',
+    'TelegramChatIDRelease': 'fake_chat_id',
+}
+_get_ok = _ENV_OK.get
+_get_no_api_key = lambda key: None if key == 'TelegramAPIKeyRelease' else 'fake_chat_id'  # noqa: E731
+_get_no_chat_id = lambda key: 'fake_api_key' if key == 'TelegramAPIKeyRelease' else None  # noqa: E731
+
+
+class ListHandler(logging.Handler):
+    # collects records in memory, cheaper than assertLogs re-wiring the logger per test
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
 
 
 class TestSendTelegramMessage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.log_handler = ListHandler()
+        logging.getLogger().addHandler(cls.log_handler)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.getLogger().removeHandler(cls.log_handler)
+
+    def setUp(self):
+        self.log_handler.records.clear()
+
     @patch('os.getenv')
-    @patch('requests.post')
+    @patch('src.notifications._session.post')
     def test_send_telegram_message_success(self, mock_post, mock_getenv):
-        mock_getenv.side_effect = lambda key: {
-            'TelegramAPIKeyRelease': 'fake_api_key',
-            'TelegramChatIDRelease': 'fake_chat_id',
-        }.get(key)
+        mock_getenv.side_effect = _get_ok
 
         # set up the mocking
         mock_resp = Mock()
@@ -26,36 +54,32 @@ class TestSendTelegramMessage(unittest.TestCase):
         # validate the expected parameters were passed
         mock_post.assert_called_once_with(
             'https://api.telegram.org/botfake_api_key/sendMessage',
-            params={'chat_id': 'fake_chat_id', 'text': 'Test Message'}
+            params={'chat_id': 'fake_chat_id', 'text': 'Test Message'},
+            timeout=10
         )
 
     @patch('os.getenv')
     def test_missing_api_key(self, mock_getenv):
-        mock_getenv.side_effect = lambda key: None if key == 'TelegramAPIKeyRelease' else 'fake_chat_id'
+        mock_getenv.side_effect = _get_no_api_key
 
         # verify the expect log message is present
-        with self.assertLogs(logging.getLogger(), level='ERROR') as log:
-            result = SendTelegramMessage('Test Message')
-            self.assertFalse(result)
-            self.assertIn('Missing TelegramAPIKey environment variable', log.output[0])
+        result = SendTelegramMessage('Test Message')
+        self.assertFalse(result)
+        self.assertIn('Missing TelegramAPIKey environment variable', self.log_handler.records[0].getMessage())
 
     @patch('os.getenv')
     def test_missing_chat_id(self, mock_getenv):
-        mock_getenv.side_effect = lambda key: 'fake_api_key' if key == 'TelegramAPIKeyRelease' else None
+        mock_getenv.side_effect = _get_no_chat_id
 
         # verify the expect log message is present
-        with self.assertLogs(logging.getLogger(), level='ERROR') as log:
-            result = SendTelegramMessage('Test Message')
-            self.assertFalse(result)
-            self.assertIn('Missing TelegramChatID environment variable', log.output[0])
+        result = SendTelegramMessage('Test Message')
+        self.assertFalse(result)
+        self.assertIn('Missing TelegramChatID environment variable', self.log_handler.records[0].getMessage())
 
     @patch('os.getenv')
-    @patch('requests.post')
+    @patch('src.notifications._session.post')
     def test_http_error(self, mock_post, mock_getenv):
-        mock_getenv.side_effect = lambda key: {
-            'TelegramAPIKeyRelease': 'fake_api_key',
-            'TelegramChatIDRelease': 'fake_chat_id',
-        }.get(key)
+        mock_getenv.side_effect = _get_ok
 
         # set up the mocking
         mock_resp = Mock()
@@ -63,17 +87,24 @@ class TestSendTelegramMessage(unittest.TestCase):
         mock_post.return_value.__enter__.return_value = mock_resp
 
         # verify the expect log message is present
-        with self.assertLogs(logging.getLogger(), level='ERROR') as log:
-            result = SendTelegramMessage('Test Message')
-            self.assertFalse(result)
-            self.assertIn('Log Review Telegram Notification Failed: Response Code 400', log.output[0])
+        result = SendTelegramMessage('Test Message')
+        self.assertFalse(result)
+        self.assertIn('Log Review Telegram Notification Failed: Response Code 400', self.log_handler.records[0].getMessage())
 
         # validate the expected parameters were passed
         mock_post.assert_called_once_with(
             'https://api.telegram.org/botfake_api_key/sendMessage',
-            params={'chat_id': 'fake_chat_id', 'text': 'Test Message'}
+            params={'chat_id': 'fake_chat_id', 'text': 'Test Message'},
+            timeout=10
         )
 
 
+class TestSendTelegramMessages(unittest.TestCase):
+    @patch('src.notifications.httpx', None)
+    def test_send_telegram_messages_requires_httpx(self):
+        with self.assertRaises(ModuleNotFoundError):
+            SendTelegramMessages(['Test Message 1', 'Test Message 2'])
+
+
 if __name__ == '__main__':
     unittest.main()